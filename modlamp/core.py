@@ -15,11 +15,9 @@ Class                            Characteristics
 """
 
 import os
-import random
 import re
 
 import numpy as np
-import pandas as pd
 import collections
 import operator
 from scipy.spatial import distance
@@ -64,6 +62,18 @@ class BaseSequence(object):
     
     """
 
+    # AA classes (constant, shared by all instances):
+    AA_hyd = ('G', 'A', 'L', 'I', 'V')
+    AA_basic = ('K', 'R')
+    AA_acidic = ('D', 'E')
+    AA_aroma = ('W', 'Y', 'F')
+    AA_polar = ('S', 'T', 'Q', 'N')
+    # AA labels:
+    AAs = ('A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V', 'W', 'Y')
+    # AA classes as read-only arrays of AA codes, used for the vectorized sequence generation:
+    _AA_hyd_u8 = np.frombuffer(''.join(AA_hyd).encode('ascii'), dtype=np.uint8)
+    _AA_basic_u8 = np.frombuffer(''.join(AA_basic).encode('ascii'), dtype=np.uint8)
+
     def __init__(self, seqnum, lenmin=7, lenmax=28):
         """
         :param seqnum: number of sequences to generate
@@ -86,14 +96,6 @@ class BaseSequence(object):
         self.lenmax = int(lenmax)
         self.seqnum = int(seqnum)
 
-        # AA classes:
-        self.AA_hyd = ['G', 'A', 'L', 'I', 'V']
-        self.AA_basic = ['K', 'R']
-        self.AA_acidic = ['D', 'E']
-        self.AA_aroma = ['W', 'Y', 'F']
-        self.AA_polar = ['S', 'T', 'Q', 'N']
-        # AA labels:
-        self.AAs = ['A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V', 'W', 'Y']
         # AA probability from the APD3 database:
         self.prob_AMP = [0.0766, 0.071, 0.026, 0.0264, 0.0405, 0.1172, 0.021, 0.061, 0.0958, 0.0838, 0.0123, 0.0386,
                          0.0463, 0.0251, 0.0545, 0.0613, 0.0455, 0.0572, 0.0155, 0.0244]
@@ -210,15 +212,15 @@ class BaseSequence(object):
         >>> b.sequences
         ['NAKAGRAWIK']
         """
+        aas = self.AAs
         for s in range(len(self.sequences)):
             # mutate: yes or no? prob = mutation probability
-            mutate = np.random.choice([1, 0], 1, p=[prob, 1 - float(prob)])
-            if mutate == 1:
+            if np.random.random() < prob:
                 seq = list(self.sequences[s])
-                cnt = 0
-                while cnt < nr:  # mutate "nr" AA
-                    seq[random.choice(range(len(seq)))] = random.choice(self.AAs)
-                    cnt += 1
+                pos = np.random.randint(0, len(seq), size=nr).tolist()
+                new = np.random.randint(0, len(aas), size=nr).tolist()
+                for p, a in zip(pos, new):  # mutate "nr" AA
+                    seq[p] = aas[a]
                 self.sequences[s] = ''.join(seq)
 
     def filter_duplicates(self):
@@ -237,10 +239,10 @@ class BaseSequence(object):
         """
         if not self.names:
             self.names = ['Seq_' + str(i) for i in range(len(self.sequences))]
-        df = pd.DataFrame(list(zip(self.sequences, self.names)), columns=['Sequences', 'Names'])
-        df = df.drop_duplicates('Sequences', 'first')  # keep first occurrence of duplicate
-        self.sequences = list(df['Sequences'])
-        self.names = list(df['Names'])
+        _, idx = np.unique(np.array(self.sequences, dtype=str), return_index=True)
+        idx = np.sort(idx).tolist()  # keep first occurrence of duplicate, in the original order
+        self.sequences = [self.sequences[i] for i in idx]
+        self.names = [self.names[i] for i in idx]
 
     def keep_natural_aa(self):
         """Method to filter out sequences that do not contain natural amino acids. If the sequence contains a character
@@ -256,16 +258,16 @@ class BaseSequence(object):
         >>> b.sequences
         ['GLFDIVKKVVGALGSL']
         """
-        natural_aa = ['A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V', 'W',
-                      'Y']
+        natural_aa = frozenset(['A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V',
+                                'W', 'Y'])
 
         seqs = []
         names = []
 
         for i, s in enumerate(self.sequences):
-            seq = list(s.upper())
-            if all(c in natural_aa for c in seq):
-                seqs.append(s.upper())
+            seq = s.upper()
+            if natural_aa.issuperset(seq):
+                seqs.append(seq)
                 if hasattr(self, 'names') and self.names:
                     names.append(self.names[i])
 
@@ -705,17 +707,14 @@ class BaseDescriptor(object):
         """
         if not self.names:
             self.names = ['Seq_' + str(i) for i in range(len(self.sequences))]
-        if not self.target:
-            self.target = [0] * len(self.sequences)
-        if not self.descriptor:
-            self.descriptor = np.zeros(len(self.sequences))
-        df = pd.DataFrame(np.array([self.sequences, self.names, self.descriptor, self.target]).T,
-                          columns=['Sequences', 'Names', 'Descriptor', 'Target'])
-        df = df.drop_duplicates('Sequences', 'first')  # keep first occurrence of duplicate
-        self.sequences = list(df['Sequences'])
-        self.names = list(df['Names'])
-        self.descriptor = df['Descriptor'].get_values()
-        self.target = df['Target'].get_values()
+        _, idx = np.unique(np.array(self.sequences, dtype=str), return_index=True)
+        idx = np.sort(idx)  # keep first occurrence of duplicate, in the original order
+        self.sequences = [self.sequences[i] for i in idx.tolist()]
+        self.names = [self.names[i] for i in idx.tolist()]
+        if hasattr(self, 'descriptor') and self.descriptor.size:
+            self.descriptor = self.descriptor[idx]
+        if hasattr(self, 'target') and self.target.size:
+            self.target = self.target[idx]
 
     def keep_natural_aa(self):
         """Method to filter out sequences that do not contain natural amino acids. If the sequence contains a character
@@ -732,8 +731,8 @@ class BaseDescriptor(object):
         ['GLFDIVKKVVGALGSL']
         """
 
-        natural_aa = ['A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V', 'W',
-                      'Y']
+        natural_aa = frozenset(['A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V',
+                                'W', 'Y'])
 
         seqs = []
         desc = []
@@ -741,9 +740,9 @@ class BaseDescriptor(object):
         target = []
 
         for i, s in enumerate(self.sequences):
-            seq = list(s.upper())
-            if all(c in natural_aa for c in seq):
-                seqs.append(s.upper())
+            seq = s.upper()
+            if natural_aa.issuperset(seq):
+                seqs.append(seq)
                 if hasattr(self, 'descriptor') and self.descriptor.size:
                     desc.append(self.descriptor[i])
                 if hasattr(self, 'names') and self.names:
@@ -1094,16 +1093,14 @@ def save_fasta(filename, sequences, names=None):
     :param names: {list} whether sequence names from self.names should be saved as sequence identifiers
     :return: a FASTA formatted file containing the generated sequences
     """
-    if os.path.exists(filename):
-        os.remove(filename)  # remove outputfile, it it exists
+    if names:
+        headers = [str(names[n]) for n in range(len(sequences))]
+    else:
+        headers = ['Seq_' + str(n) for n in range(len(sequences))]
+    fasta = ''.join(['>%s\n%s\n' % (h, seq) for h, seq in zip(headers, sequences)])
 
-    with open(filename, 'w') as o:
-        for n, seq in enumerate(sequences):
-            if names:
-                o.write('>' + str(names[n]) + '\n')
-            else:
-                o.write('>Seq_' + str(n) + '\n')
-            o.write(seq + '\n')
+    with open(filename, 'wb') as o:  # overwrites the output file, if it exists
+        o.write(fasta.encode('utf-8'))
 
 
 def aa_weights():
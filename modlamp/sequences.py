@@ -31,9 +31,13 @@ automation or looping over different classes.
 .. seealso:: :class:`modlamp.core.BaseSequence` from which all classes in this module inherit.
 """
 
-from itertools import cycle
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from functools import reduce
+from itertools import accumulate, cycle
 
 import numpy as np
+from joblib import Parallel, delayed
 
 from modlamp.core import BaseSequence, ngrams_apd
 
@@ -41,6 +45,78 @@ __author__ = "Alex Müller, Gisela Gabernet"
 __docformat__ = "restructuredtext en"
 
 
+def _one_sublibrary(seqclass, seqnum, seed, *args):
+    """Private function used for generating the sequences of one sub-library, possibly in a separate worker process.
+    This function is used by the :py:func:`generate_sequences` method of :py:class:`MixedLibrary`. The global
+    ``np.random`` state is restored afterwards, as joblib may run this function in the calling process.
+
+    :param seqclass: {class} sequence class from this module to generate the sub-library with
+    :param seqnum: {int} number of sequences to generate
+    :param seed: {int} seed for the random number generator of the sub-library, to avoid correlated random streams
+    :param args: arguments passed on to :py:func:`generate_sequences` of **seqclass**
+    :return: {list} generated sequences
+    """
+    state = np.random.get_state()
+    np.random.seed(seed)
+    try:
+        sub = seqclass(seqnum, 7, 28)
+        sub.generate_sequences(*args)
+    finally:
+        np.random.set_state(state)
+    return sub.sequences
+
+
+def _helix_kernel(seqnum, lenmin, lenmax, basic, hyd, oblique=False):
+    """Private function generating the AA codes of all presumed amphipathic helical sequences at once. Every sequence
+    is filled up by hydrophobic AAs, then basic residues are placed along the sequence with distance 3-4 AA to each
+    other, starting from a random position from 0 to 3. This function is used by the :py:func:`generate_sequences`
+    methods of :py:class:`Helices`, :py:class:`Kinked` and :py:class:`Oblique`.
+
+    :param seqnum: {int} number of sequences to generate
+    :param lenmin: {int} minimal length of the generated sequences
+    :param lenmax: {int} maximal length of the generated sequences
+    :param basic: {numpy.ndarray} uint8 codes of the basic amino acids to choose from
+    :param hyd: {numpy.ndarray} uint8 codes of the hydrophobic amino acids to choose from
+    :param oblique: {bool} whether to keep the last third of every sequence free of basic residues
+    :return: {tuple} AA code matrix of type uint8 with one sequence per row, sequence lengths, positions of the basic
+        residues per row and the mask of the positions actually used
+    """
+    if lenmin == lenmax:  # fixed length: nothing to draw
+        lengths = np.full(seqnum, lenmax)
+    else:
+        lengths = np.random.randint(lenmin, lenmax + 1, size=seqnum)
+    first = np.random.randint(0, 4, size=seqnum)  # spot for first basic residue from 0 to 3
+    # fill all sequences with hydrophobic residues, one row per sequence; drawing uint8 indices and looking them up
+    # is cheaper than np.random.choice for such a large matrix
+    seqs = hyd.take(np.random.randint(0, hyd.size, size=(seqnum, lenmax), dtype=np.uint8))
+    # positions of the basic residues relative to the first one: alternating gaps of 3 & 4 --> 0,3,7,10,14...
+    gaps = np.concatenate(([0], np.cumsum(np.tile([3, 4], lenmax // 7 + 1))))
+    pos = first[:, np.newaxis] + gaps
+    if oblique:  # no basic residues in the last 3rd of the sequence --> hydrophobicity gradient = oblique
+        end = lengths - np.maximum(lengths // 3 - 1, 0)
+    else:
+        end = lengths
+    mask = pos < end[:, np.newaxis]  # basic positions inside the sequence
+    rows = np.nonzero(mask)[0]
+    seqs[rows, pos[mask]] = basic.take(np.random.randint(0, basic.size, size=rows.size, dtype=np.uint8))
+    return seqs, lengths, pos, mask
+
+
+def _decode_rows(seqs, lengths):
+    """Private function to decode a matrix of AA codes, e.g. as returned by :py:func:`_helix_kernel`, into a list of
+    sequence strings of the given lengths.
+
+    :param seqs: {numpy.ndarray} uint8 matrix of AA codes with one sequence per row
+    :param lengths: {numpy.ndarray} length of every sequence
+    :return: {list} sequences
+    """
+    flat = seqs.tobytes().decode('ascii')  # decode all rows in one go and slice the sequences out
+    width = seqs.shape[1]
+    if not len(lengths) or lengths.min() == width:  # all sequences span the full row
+        return [flat[start:start + width] for start in range(0, len(flat), width)]
+    return [flat[start:start + l] for start, l in zip(range(0, width * len(lengths), width), lengths.tolist())]
+
+
 class Random(BaseSequence):
     """Class for random peptide sequences.
 
@@ -108,11 +184,16 @@ class Random(BaseSequence):
             self.prob = proba
         # else just keep self.prob which is defined as equal probabilities for all AA
 
-        for s in range(self.seqnum):
-            seq = []
-            for l in range(np.random.choice(range(self.lenmin, self.lenmax + 1))):
-                seq.append(np.random.choice(self.AAs, replace=True, p=self.prob))  # weighed random selection of AA
-            self.sequences.append(''.join(seq))
+        cdf = np.cumsum(self.prob)
+        cdf /= cdf[-1]  # cumulative AA probabilities, normalized to end exactly at 1
+        lens = np.random.randint(self.lenmin, self.lenmax + 1, size=self.seqnum)
+        # weighed random selection of all AA of all sequences in one draw
+        idx = np.searchsorted(cdf, np.random.random(lens.sum()), side='right')
+        aas = self.AAs
+        flat = ''.join([aas[i] for i in idx.tolist()])  # plain str, no numpy.str_ per residue
+        ends = np.cumsum(lens).tolist()
+        # slice the single sequences out of the flat AA string
+        self.sequences.extend([flat[start:end] for start, end in zip([0] + ends[:-1], ends)])
 
 
 class Helices(BaseSequence):
@@ -134,23 +215,9 @@ class Helices(BaseSequence):
         ['KGIKVILKLAKAGVKAVRL','IILKVGKV','IAKAGRAIIK','LKILKVVGKGIRLIVRIIKAL','KAGKLVAKGAKVAAKAIKI']
         """
         self.clean()
-        for s in range(self.seqnum):  # for the number of sequences to generate
-            seq = ['X'] * np.random.choice(range(self.lenmin, self.lenmax + 1))
-            basepos = np.random.choice(range(4))  # select spot for first basic residue from 0 to 3
-            seq[basepos] = np.random.choice(self.AA_basic)  # place first basic residue
-            it = cycle([3, 4])  # gap cycle of 3 & 4 --> 3,4,3,4,3,4...
-            g = next(it)
-            while g + basepos < len(seq):
-                # place more basic residues 3-4 positions further (changing between distance 3 and 4)
-                basepos += g
-                seq[basepos] = np.random.choice(self.AA_basic)  # place more basic residues
-                g = next(it)  # next gap
-            
-            for p in range(len(seq)):
-                while seq[p] == 'X':  # fill up remaining spots with hydrophobic AAs
-                    seq[p] = np.random.choice(self.AA_hyd)
-            
-            self.sequences.append(''.join(seq))
+        seqs, lengths, _, _ = _helix_kernel(self.seqnum, self.lenmin, self.lenmax, self._AA_basic_u8,
+                                            self._AA_hyd_u8)
+        self.sequences = _decode_rows(seqs, lengths)
 
 
 class Kinked(BaseSequence):
@@ -174,30 +241,15 @@ class Kinked(BaseSequence):
         ['IILRLHPIG','ARGAKVAIKAIRGIAPGGRVVAKVVKVG','GGKVGRGVAFLVRIILK','KAVKALAKGAPVILCVAKVI', ...]
         """
         self.clean()
-        for s in range(self.seqnum):  # for the number of sequences to generate
-            poslist = []  # used to
-            seq = ['X'] * np.random.choice(range(self.lenmin, self.lenmax + 1))
-            basepos = np.random.choice(range(4))  # select spot for first basic residue from 0 to 3
-            seq[basepos] = np.random.choice(self.AA_basic)  # place first basic residue
-            poslist.append(basepos)
-            it = cycle([3, 4])  # gap cycle of 3 & 4 --> 3,4,3,4,3,4...
-            g = next(it)
-            while g + basepos < len(seq):
-                # place more basic residues 3-4 positions further (changing between distance 3 and 4)
-                basepos += g
-                seq[basepos] = np.random.choice(self.AA_basic)  # place more basic residues
-                g = next(it)  # next gap
-                poslist.append(basepos)
-            
-            for p in range(len(seq)):
-                while seq[p] == 'X':  # fill up remaining spots with hydrophobic AAs
-                    seq[p] = np.random.choice(self.AA_hyd)
-            
-            # place proline around the middle of the sequence
-            propos = poslist[int(len(poslist) / 2)]
-            seq[propos] = 'P'
-            
-            self.sequences.append(''.join(seq))
+        seqs, lengths, pos, mask = _helix_kernel(self.seqnum, self.lenmin, self.lenmax, self._AA_basic_u8,
+                                                 self._AA_hyd_u8)
+        
+        # replace the middle basic residue of every sequence by proline
+        nb = mask.sum(axis=1)  # number of basic residues per sequence
+        idx = np.arange(self.seqnum)
+        seqs[idx, pos[idx, nb // 2]] = ord('P')
+        
+        self.sequences = _decode_rows(seqs, lengths)
 
 
 class Oblique(BaseSequence):
@@ -220,27 +272,9 @@ class Oblique(BaseSequence):
         ['GLLKVIRIAAKVLKVAVLVGIIAI','AIGKAGRLALKVIKVVIKVALILLAAVA','KILRAAARVIKGGIKAIVIL','VRLVKAIGKLLRIILRLARLAVGGILA']
         """
         self.clean()
-        for s in range(self.seqnum):  # for the number of sequences to generate
-            seq = ['X'] * np.random.choice(range(self.lenmin, self.lenmax + 1))
-            basepos = np.random.choice(range(4))  # select spot for first basic residue from 0 to 3
-            seq[basepos] = np.random.choice(self.AA_basic)  # place first basic residue
-            it = cycle([3, 4])  # iterative cycle of 3 & 4 --> 3,4,3,4,3,4...
-            g = next(it)
-            while g + basepos < len(seq):
-                # place more basic residues 3-4 positions further (changing between distance 3 and 4)
-                basepos += g
-                seq[basepos] = np.random.choice(self.AA_basic)  # place more basic residues
-                g = next(it)  # next gap
-            
-            for p in range(len(seq)):
-                while seq[p] == 'X':  # fill up remaining spots with hydrophobic AAs
-                    seq[p] = np.random.choice(self.AA_hyd)
-            
-            for e in range(1, int(len(seq) / 3)):
-                # transform last 3rd of sequence into hydrophobic ones --> hydrophobicity gradient = oblique
-                seq[-e] = np.random.choice(self.AA_hyd)
-            
-            self.sequences.append(''.join(seq))
+        seqs, lengths, _, _ = _helix_kernel(self.seqnum, self.lenmin, self.lenmax, self._AA_basic_u8,
+                                            self._AA_hyd_u8, oblique=True)
+        self.sequences = _decode_rows(seqs, lengths)
 
 
 class Centrosymmetric(BaseSequence):
@@ -271,48 +305,38 @@ class Centrosymmetric(BaseSequence):
         """
         if symmetry == 'symmetric':
             self.clean()
-            for s in range(self.seqnum):  # iterate over number of sequences to generate
-                n = np.random.choice(range(2, 4))  # number of sequence blocks to take (2 or 3)
-                seq = ['X'] * 7  # template sequence AA list with length 7
-                for a in range(7):  # generate symmetric sequence block of 7 AA with an anchor in the middle
-                    if a == 0:
-                        seq[0] = np.random.choice(self.AA_hyd)
-                        seq[6] = seq[0]
-                    elif a == 1:
-                        seq[1] = np.random.choice(self.AA_basic)
-                        seq[5] = seq[1]
-                    elif a == 2:
-                        seq[2] = np.random.choice(self.AA_hyd)
-                        seq[4] = seq[2]
-                    elif a == 3:
-                        seq[3] = np.random.choice(self.AA_aroma)
-                    else:
-                        continue
-                self.sequences.append(''.join(seq) * n)
+            # draw every block position for all sequences at once
+            hyd1 = np.random.choice(self.AA_hyd, self.seqnum)
+            bas = np.random.choice(self.AA_basic, self.seqnum)
+            hyd2 = np.random.choice(self.AA_hyd, self.seqnum)
+            anc = np.random.choice(self.AA_aroma, self.seqnum)
+            # assemble symmetric sequence blocks of 7 AA with an anchor in the middle
+            blocks = reduce(np.char.add, [hyd1, bas, hyd2, anc, hyd2, bas, hyd1])
+            n = np.random.randint(2, 4, size=self.seqnum)  # number of sequence blocks to take (2 or 3)
+            self.sequences = [b * k for b, k in zip(blocks.tolist(), n.tolist())]
         
         elif symmetry == 'asymmetric':
             self.clean()
-            for s in range(self.seqnum):  # iterate over number of sequences to generate
-                n = np.random.choice(range(2, 4))  # number of sequence blocks to take (2 or 3)
-                seq = ['X'] * 7  # template sequence AA list with length 7
-                blocks = []
-                for c in range(n):
-                    for a in range(7):  # generate symmetric sequence block of 7 AA with an anchor in the middle
-                        if a == 0:
-                            seq[0] = np.random.choice(self.AA_hyd)
-                            seq[6] = seq[0]
-                        elif a == 1:
-                            seq[1] = np.random.choice(self.AA_basic)
-                            seq[5] = seq[1]
-                        elif a == 2:
-                            seq[2] = np.random.choice(self.AA_hyd)
-                            seq[4] = seq[2]
-                        elif a == 3:
-                            seq[3] = np.random.choice(self.AA_aroma)
-                        else:
-                            continue
-                    blocks.append(''.join(seq))
-                self.sequences.append(''.join(blocks))
+            hyd, basic = self._AA_hyd_u8, self._AA_basic_u8  # AA classes as arrays of AA codes
+            aroma = np.frombuffer(''.join(self.AA_aroma).encode('ascii'), dtype=np.uint8)
+            ns = np.random.randint(2, 4, size=self.seqnum).tolist()  # number of sequence blocks to take (2 or 3)
+            nb = sum(ns)
+            # draw the residues of all blocks of all sequences at once
+            hyds = iter(hyd.take(np.random.randint(0, hyd.size, size=2 * nb)).tolist())
+            basics = iter(basic.take(np.random.randint(0, basic.size, size=nb)).tolist())
+            aromas = iter(aroma.take(np.random.randint(0, aroma.size, size=nb)).tolist())
+            out = []
+            append = out.append
+            for n in ns:  # iterate over number of sequences to generate
+                seq = bytearray(7 * n)  # sequence buffer of AA codes holding all blocks
+                for c in range(0, 7 * n, 7):
+                    # generate symmetric sequence block of 7 AA with an anchor in the middle, starting at position c
+                    seq[c] = seq[c + 6] = next(hyds)
+                    seq[c + 1] = seq[c + 5] = next(basics)
+                    seq[c + 2] = seq[c + 4] = next(hyds)
+                    seq[c + 3] = next(aromas)
+                append(seq.decode('ascii'))
+            self.sequences.extend(out)
         
         else:
             raise AttributeError('Unknown symmetry option given! Choose from [symmetric, asymmetric].')
@@ -387,17 +411,25 @@ class AmphipathicArc(BaseSequence):
         else:
             raise AttributeError("Arc size unknown, choose among: 100, 140, 180, 220, 260 or 'mixed'")
 
+        cums = [list(accumulate(p)) for p in self.prob_amphihel]  # cumulative AA probabilities (polar, hydrophobic)
+        aas = ''.join(self.AAs).encode('ascii')  # AA codes
         idxcycle = cycle(idx)
         idx = next(idxcycle)
-        for s in range(self.seqnum):
-            seq = []
+        lengths = np.random.randint(self.lenmin, self.lenmax + 1, size=self.seqnum).tolist()  # all lengths at once
+        rands = iter(np.random.random(sum(lengths)).tolist())  # one random number per residue
+        out = []
+        append = out.append
+        for l in lengths:
+            seq = bytearray(l)  # sequence buffer of AA codes
             icycle = cycle(idx)  # jumping from one probability to next one in idx array
             i = next(icycle)
-            for n in range(np.random.choice(range(self.lenmin, self.lenmax + 1))):
-                seq.append(np.random.choice(self.AAs, p=self.prob_amphihel[i]))
+            for n in range(l):
+                cum = cums[i]
+                seq[n] = aas[bisect_right(cum, next(rands) * cum[-1])]  # weighed random selection of AA
                 i = next(icycle)
-            self.sequences.append(''.join(seq))
+            append(seq.decode('ascii'))
             idx = next(idxcycle)
+        self.sequences.extend(out)
     
     def make_H_gradient(self):
         """Method to mutate the generated sequences to have a hydrophobic gradient by substituting the last third of
@@ -411,11 +443,15 @@ class AmphipathicArc(BaseSequence):
         >>> amphi_grad.make_H_gradient()
         >>> amphi_grad.sequences
         """
+        aas = ''.join(self.AAs).encode('ascii')  # AA codes
+        cum = list(accumulate(self.prob_amphihel[1]))  # cumulative hydrophobic AA probabilities
+        # one random number per substituted residue
+        rands = iter(np.random.random(sum(int(len(seq) / 3) for seq in self.sequences)).tolist())
         for s in range(len(self.sequences)):
-            seq = list(self.sequences[s])
+            seq = bytearray(self.sequences[s], 'ascii')
             for aa in range(1, int(len(seq) / 3 + 1)):
-                seq[-aa] = np.random.choice(self.AAs, p=self.prob_amphihel[1])
-            self.sequences[s] = ''.join(seq)
+                seq[-aa] = aas[bisect_right(cum, next(rands) * cum[-1])]
+            self.sequences[s] = seq.decode('ascii')
 
 
 class HelicesACP(BaseSequence):
@@ -445,12 +481,16 @@ class HelicesACP(BaseSequence):
         ['FLFDVAKKVAGTALT', 'GLGIILGAGG', 'GLRIKLGVWAKKA', 'GFWGFIKTI']
         """
         self.clean()
-        for s in range(self.seqnum):
-            seq = str()
-            for l in range(np.random.choice(range(self.lenmin, self.lenmax + 1))):
-                i = l % 18  # for helices >18aa, the probabilities start from the beginning again
-                seq += np.random.choice(self.AAs, p=self.prob_ACPhel.T[i])
-            self.sequences.append(seq)
+        aas = np.frombuffer(''.join(self.AAs).encode('ascii'), dtype=np.uint8)  # AA codes
+        cdfs = np.cumsum(self.prob_ACPhel, axis=0)
+        cdfs /= cdfs[-1]  # cumulative AA probabilities per helix position, normalized to end exactly at 1
+        lengths = np.random.randint(self.lenmin, self.lenmax + 1, size=self.seqnum)
+        rand = np.random.random((self.seqnum, self.lenmax))
+        seqs = np.empty((self.seqnum, self.lenmax), dtype=np.uint8)  # AA codes, one row per sequence
+        for l in range(self.lenmax):  # weighed random selection of the AA at position l for all sequences at once
+            cdf = cdfs[:, l % 18]  # for helices >18aa, the probabilities start from the beginning again
+            seqs[:, l] = aas[np.searchsorted(cdf, rand[:, l], side='right')]
+        self.sequences = _decode_rows(seqs, lengths)
 
 
 class MixedLibrary(BaseSequence):
@@ -496,10 +536,14 @@ class MixedLibrary(BaseSequence):
                      'AMP': int(round(float(self.libsize) * self.ratios['AMP'], ndigits=0)),
                      'nCM': int(round(float(self.libsize) * self.ratios['nCM'], ndigits=0))}
     
-    def generate_sequences(self):
+    def generate_sequences(self, n_jobs=1):
         """This method generates a virtual sequence library with the subtype ratios initialized in class :class:`MixedLibrary()`.
         All sequences are between 7 and 28 amino acids in length.
 
+        :param n_jobs: {int} number of parallel jobs to generate the sub-libraries with. if ``-1``, all available cores
+            are used. The sub-library generators are vectorized, so starting worker processes and sending the
+            sequences back usually costs more than it saves; more jobs only pay off for very large libraries (in the
+            order of millions of sequences) on multi-core machines. By default, everything runs in the calling process.
         :return: a virtual library of sequences in the attribute :py:attr:`sequences`, the sub-library class names in
             :py:attr:`names`, the number of sequences generated for each class in :py:attr:`nums` and the library size in
             :py:attr:`libsize`.
@@ -522,53 +566,46 @@ class MixedLibrary(BaseSequence):
         'ran': 2326,
         'sym': 1163}
         """
-        Cs = Centrosymmetric(self.nums['sym'])
-        Cs.generate_sequences(symmetry='symmetric')
-        Ca = Centrosymmetric(self.nums['asy'])
-        Ca.generate_sequences(symmetry='asymmetric')
-        H = Helices(7, 28, self.nums['hel'])
-        H.generate_sequences()
-        K = Kinked(7, 28, self.nums['knk'])
-        K.generate_sequences()
-        O = Oblique(7, 28, self.nums['obl'])
-        O.generate_sequences()
-        R = Random(7, 28, self.nums['ran'])
-        R.generate_sequences('rand')
-        Ra = Random(7, 28, self.nums['AMP'])
-        Ra.generate_sequences('AMP')
-        Rc = Random(7, 28, self.nums['nCM'])
-        Rc.generate_sequences('AMPnoCM')
+        tasks = [('sym', Centrosymmetric, ('symmetric',)), ('asy', Centrosymmetric, ('asymmetric',)),
+                 ('hel', Helices, ()), ('knk', Kinked, ()), ('obl', Oblique, ()), ('ran', Random, ('rand',)),
+                 ('AMP', Random, ('AMP',)), ('nCM', Random, ('AMPnoCM',))]
+        # one independent random stream per sub-library: spawn child seeds from a master seed drawn from the global
+        # state, so that np.random.seed() still makes the library reproducible
+        master = np.random.SeedSequence(np.random.randint(0, 2 ** 31 - 1))
+        seeds = [int(child.generate_state(1)[0]) for child in master.spawn(len(tasks))]
+        sublibs = Parallel(n_jobs=n_jobs)(delayed(_one_sublibrary)(c, self.nums[k], seed, *a)
+                                          for (k, c, a), seed in zip(tasks, seeds))
         
         # TODO: update libnums according to real numbers
         
-        sequences = Cs.sequences + Ca.sequences + H.sequences + K.sequences + O.sequences + R.sequences \
-                    + Ra.sequences + Rc.sequences
-        names = ['sym'] * self.nums['sym'] + ['asy'] * self.nums['asy'] + ['hel'] * self.nums['hel'] + \
-                ['knk'] * self.nums['knk'] + ['obl'] * self.nums['obl'] + ['ran'] * self.nums['ran'] + \
-                ['AMP'] * self.nums['AMP'] + ['nCM'] * self.nums['nCM']
-        # combining sequence and name to remove duplicates
-        comb = []
-        for i, s in enumerate(sequences):
-            comb.append(s + '_' + names[i])
-        comb = set(comb)
-        # remove duplicates
-        for c in comb:
-            self.sequences.append(c.split('_')[0])
-            self.names.append(c.split('_')[1])
+        sequences = [seq for sub in sublibs for seq in sub]
+        names = [k for (k, c, a), sub in zip(tasks, sublibs) for seq in sub]
+        # remove duplicates, keeping the first occurrence of every sequence together with its sub-library name
+        uniq = OrderedDict()
+        for s, n in zip(sequences, names):
+            uniq.setdefault(s, n)
+        self.sequences = list(uniq.keys())
+        self.names = list(uniq.values())
         # update libsize and nums
         self.libsize = len(self.sequences)
-        self.nums = {k: self.names.count(k) for k in self.nums.keys()}  # update the number of sequences for every class
+        cnt = Counter(self.names)
+        self.nums = {k: cnt[k] for k in self.nums.keys()}  # update the number of sequences for every class
     
     def prune_library(self, newsize):
-        """Method to cut down a library to the given new size.
+        """Method to cut down a library to the given new size. A random subset of **newsize** sequences is kept
+        (drawn with ``np.random``), in the original order of the library. Since the library is ordered by
+        sub-library, this keeps the sub-library ratios on average, whereas cutting off the end would drop whole
+        sub-libraries.
 
         :param newsize: new desired size of the mixed library
         :return: adapted library with corresponding attributes (sequences, names, libsize, nums)
         """
-        self.names = self.names[:newsize]
-        self.sequences = self.sequences[:newsize]
+        keep = np.sort(np.random.choice(len(self.sequences), min(newsize, len(self.sequences)), replace=False)).tolist()
+        self.names = [self.names[i] for i in keep]
+        self.sequences = [self.sequences[i] for i in keep]
         self.libsize = len(self.sequences)
-        self.nums = {k: self.names.count(k) for k in self.nums.keys()}  # update the number of sequences for every class
+        cnt = Counter(self.names)
+        self.nums = {k: cnt[k] for k in self.nums.keys()}  # update the number of sequences for every class
 
 
 class Hepahelices(BaseSequence):
@@ -596,30 +633,35 @@ class Hepahelices(BaseSequence):
         ['GRLARSLKRKLNRLVRGGGRLVRGGG', 'IRSIRRRLSKLARSLGRGARSLGRG', 'RAVKRKVNKLLKGAAKVLKGAAKVLKGAAK', ... ]
         """
         self.clean()
-        for s in range(self.seqnum):  # for the number of sequences to generate
+        n = self.seqnum
+        lengths = np.random.randint(self.lenmin, self.lenmax + 1, size=n).tolist()  # all lengths at once
+        # draw the residues of all sequences at once, one row per sequence
+        hyds = np.array(self.AA_hyd)[np.random.randint(0, len(self.AA_hyd), size=(n, 9))].tolist()
+        basics = np.array(self.AA_basic)[np.random.randint(0, len(self.AA_basic), size=(n, 8))].tolist()
+        polars = np.array(self.AA_polar)[np.random.randint(0, len(self.AA_polar), size=n)].tolist()
+        ags = np.array(['A', 'G'])[np.random.randint(0, 2, size=(n, 2))].tolist()
+        agsts = np.array(['A', 'G', 'S', 'T'])[np.random.randint(0, 4, size=(n, 2))].tolist()
+        befs = np.random.random(n).tolist()  # fraction of the remaining positions to put before the HBD
+        out = []
+        append = out.append
+        for l, h, k, p, ag, agst, f in zip(lengths, hyds, basics, polars, ags, agsts, befs):
             # generate heparin binding domain with the from HBBBHPBH (H: hydrophobic, B: basic, P: polar)
-            hbd = [np.random.choice(self.AA_hyd)] + [np.random.choice(self.AA_basic)] + [np.random.choice(self.AA_basic)] + \
-                  [np.random.choice(self.AA_basic)] + [np.random.choice(self.AA_hyd)] + [np.random.choice(self.AA_polar)] + \
-                  [np.random.choice(self.AA_basic)] + [np.random.choice(self.AA_hyd)]
+            hbd = [h[0], k[0], k[1], k[2], h[1], p, k[3], h[2]]
             # generate amphipathic block to add in front of HBD
-            bef = [np.random.choice(self.AA_hyd)] + [np.random.choice(['A', 'G'])] + [np.random.choice(self.AA_basic)] + \
-                  [np.random.choice(self.AA_hyd)] + [np.random.choice(self.AA_hyd)] + [np.random.choice(self.AA_basic)] + \
-                  [np.random.choice(['A', 'G', 'S', 'T'])]
+            bef = [h[3], ag[0], k[4], h[4], h[5], k[5], agst[0]]
             # generate amphipathic block to add after HBD
-            aft = [np.random.choice(self.AA_hyd)] + [np.random.choice(self.AA_basic)] + \
-                  [np.random.choice(['A', 'G', 'S', 'T'])] + [np.random.choice(self.AA_hyd)] + \
-                  [np.random.choice(['A', 'G'])] + [np.random.choice(self.AA_basic)] + [np.random.choice(self.AA_hyd)]
-            l = np.random.choice(range(self.lenmin, self.lenmax + 1))  # total sequence length
-            try:
-                r = l - 8  # remaining empty positions in sequence
-                b = np.random.choice(r)  # positions before HBD
+            aft = [h[6], k[6], agst[1], h[7], ag[1], k[7], h[8]]
+            r = l - 8  # remaining empty positions in sequence
+            if r > 0:
+                b = int(f * r)  # positions before HBD
                 a = r - b  # positions after HBD
                 seq = 3 * bef + hbd + 3 * aft
                 seq = seq[21 - b: 29 + a]
-            except ValueError:  # if sequence length is 8, take HBD as whole sequence
+            else:  # if sequence length is 8, take HBD as whole sequence
                 seq = hbd
             
-            self.sequences.append(''.join(seq))
+            append(''.join(seq))
+        self.sequences.extend(out)
 
 
 class AMPngrams(BaseSequence):
@@ -658,7 +700,11 @@ class AMPngrams(BaseSequence):
         
         :return: list of sequences in :py:attr:`sequences`
         """
+        ngrams = self.ngrams
+        out = []
+        append = out.append
         for _ in range(self.seqnum):
             size = np.random.randint(self.n_min, self.n_max)  # number of ngrams to choose from list to build sequence
             # build sequence from a random selection of ngrams
-            self.sequences.append(''.join(self.ngrams[np.random.randint(0, self.ngrams.shape[0], size=size)].tolist()))
+            append(''.join(ngrams[np.random.randint(0, ngrams.shape[0], size=size)].tolist()))
+        self.sequences.extend(out)
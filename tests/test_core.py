@@ -1,7 +1,8 @@
 import unittest
+import numpy as np
 from modlamp.core import BaseSequence, BaseDescriptor
 from modlamp.sequences import Random
-from modlamp.descriptors import PeptideDescriptor
+from modlamp.descriptors import PeptideDescriptor, GlobalDescriptor
 from os.path import dirname, join
 
 
@@ -31,6 +32,16 @@ class TestCore(unittest.TestCase):
         self.b.filter_duplicates()
         self.assertEqual(len(self.b.sequences), 4)
 
+    def test_filter_duplicates_descriptor(self):
+        g = GlobalDescriptor(['GLFDIVKKVVGALG', 'KLLKLL', 'GLFDIVKKVVGALG', 'AAGGKKLLA', 'KLLKLL'])
+        g.length()
+        g.target = np.array([1, 0, 1, 1, 0])
+        g.filter_duplicates()
+        self.assertEqual(g.sequences, ['GLFDIVKKVVGALG', 'KLLKLL', 'AAGGKKLLA'])
+        self.assertEqual(g.names, ['Seq_0', 'Seq_1', 'Seq_3'])
+        self.assertEqual(g.descriptor.tolist(), [[14.], [6.], [9.]])  # rows stay aligned, values stay numeric
+        self.assertEqual(g.target.tolist(), [1, 0, 1])
+
     def test_keep_natural_aa(self):
         self.assertIn('ABCDEFGHIJKLMNOPQRSTUVWXYZ', self.s.sequences)
         self.s.keep_natural_aa()
@@ -0,0 +1,50 @@
+import random
+import unittest
+
+import numpy as np
+
+from modlamp.sequences import MixedLibrary
+
+
+class TestMixedLibrary(unittest.TestCase):
+    L = MixedLibrary(400)
+    L.generate_sequences()
+
+    def test_no_duplicates(self):
+        self.assertEqual(len(set(self.L.sequences)), len(self.L.sequences))
+
+    def test_names(self):
+        self.assertEqual(len(self.L.names), len(self.L.sequences))
+        self.assertEqual(self.L.libsize, len(self.L.sequences))
+        self.assertEqual(sum(self.L.nums.values()), self.L.libsize)
+
+    def test_sublibrary_lengths(self):
+        for s, n in zip(self.L.sequences, self.L.names):
+            if n in ('sym', 'asy'):
+                self.assertIn(len(s), (14, 21))
+            else:
+                self.assertTrue(7 <= len(s) <= 28)
+
+    def test_prune(self):
+        L = MixedLibrary(400)
+        L.generate_sequences()
+        L.prune_library(100)
+        self.assertEqual(L.libsize, 100)
+        self.assertEqual(len(L.names), 100)
+        self.assertEqual(sum(L.nums.values()), 100)
+
+    def test_caller_rng_state(self):
+        random.seed(123)
+        state = random.getstate()
+        np.random.seed(123)
+        MixedLibrary(50).generate_sequences(n_jobs=1)  # sub-libraries are generated in this process
+        after = np.random.random()
+        # the only draw from the caller's np.random state is the master seed of the sub-library streams
+        np.random.seed(123)
+        np.random.randint(0, 2 ** 31 - 1)
+        self.assertEqual(after, np.random.random())
+        self.assertEqual(random.getstate(), state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,7 +13,8 @@ class TestRandom(unittest.TestCase):
 
     def test_seq_len(self):
         for seq in self.S.sequences:
-            self.assertIn(len(seq), range(10, 31))
+            self.assertGreaterEqual(len(seq), 10)
+            self.assertLessEqual(len(seq), 30)
 
     def test_noCM(self):
         for s in self.S.sequences: